@@ -3,13 +3,108 @@ Binance USDⓈ-M Futures Trading Bot
 Supports buying and selling cryptocurrency pairs with configurable parameters.
 """
 
+import asyncio
 import hashlib
 import hmac
+import json
+import re
+import sys
+import threading
 import time
-import requests
+import httpx
 import urllib.parse
-from typing import Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
 from enum import Enum
+from types import MappingProxyType
+
+try:
+    # orjson decodes large payloads such as exchangeInfo several times faster
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Passing the digest by name lets hmac use OpenSSL's HMAC implementation, which
+# picks the hardware SHA-256 path (SHA-NI, ARMv8 SHA2, s390x CPACF) at runtime
+_HMAC_DIGEST = "sha256"
+
+# True when SHA-256 is served by OpenSSL rather than CPython's builtin fallback
+OPENSSL_SHA256 = getattr(hashlib.sha256, "__name__", "") == "openssl_sha256"
+
+# Request weight per method and endpoint (USDⓈ-M Futures API docs); unlisted
+# requests weigh 1, e.g. DELETE /fapi/v1/batchOrders (Cancel Multiple Orders)
+_ENDPOINT_WEIGHTS = {
+    ("GET", "/fapi/v2/account"): 5,
+    ("GET", "/fapi/v2/positionRisk"): 5,
+    ("POST", "/fapi/v1/batchOrders"): 5,
+}
+
+# The weight bucket holds at most this many seconds of refill. Binance counts
+# weight in fixed one-minute windows, so a bucket that could hold a full
+# minute's budget would allow close to twice the limit within one window.
+_WEIGHT_BURST_SECONDS = 6
+
+# Maximum number of orders per /fapi/v1/batchOrders request
+_BATCH_PLACE_SIZE = 5
+_BATCH_CANCEL_SIZE = 10
+
+# Weight of endpoints whose cost rises when the optional symbol is omitted
+_NO_SYMBOL_WEIGHTS = {
+    "/fapi/v1/openOrders": 40,
+    "/fapi/v1/ticker/price": 2,
+}
+
+
+# Values made only of unreserved characters need no percent-encoding
+_SAFE_VALUE = re.compile(r'[A-Za-z0-9_.\-]+').fullmatch
+
+
+def _fast_urlencode(params: Dict[str, Any]) -> str:
+    """
+    Encode request parameters as a query string
+    
+    Produces the same output as urlencode(params, doseq=True, quote_via=quote)
+    for Binance parameters (ASCII-safe names), except that booleans become
+    'true'/'false'. Only values that contain reserved characters are
+    percent-encoded; numbers, symbols and enum strings are appended as-is.
+    
+    Args:
+        params: Request parameters; list/tuple values are repeated
+        
+    Returns:
+        The encoded query string
+    """
+    parts = []
+    for key, value in params.items():
+        values = value if isinstance(value, (list, tuple)) else (value,)
+        for item in values:
+            if isinstance(item, bool):
+                text = "true" if item else "false"
+            else:
+                text = item if isinstance(item, str) else str(item)
+            if not _SAFE_VALUE(text):
+                text = urllib.parse.quote(text, safe='')
+            parts.append(f"{key}={text}")
+    return "&".join(parts)
+
+
+def _request_weight(method: str, endpoint: str, params: Optional[Dict[str, Any]]) -> int:
+    """
+    Return the request weight Binance charges for a call
+    
+    Args:
+        method: HTTP method (GET, POST, DELETE, PUT)
+        endpoint: API endpoint (e.g., '/fapi/v1/order')
+        params: Request parameters
+        
+    Returns:
+        Request weight
+    """
+    if endpoint in _NO_SYMBOL_WEIGHTS and not (params and "symbol" in params):
+        return _NO_SYMBOL_WEIGHTS[endpoint]
+    return _ENDPOINT_WEIGHTS.get((method, endpoint), 1)
 
 
 class OrderSide(Enum):
@@ -35,6 +130,114 @@ class TimeInForce(Enum):
     IOC = "IOC"  # Immediate or Cancel
     FOK = "FOK"  # Fill or Kill
     GTX = "GTX"  # Good Till Crossing (Post Only)
+    GTD = "GTD"  # Good Till Date
+
+
+# Upper-cased, interned API strings, so repeated values are normalized only once
+_UPPER_CACHE: Dict[str, str] = {}
+
+_ENUM_VALUES = {
+    enum_cls: frozenset(member.value for member in enum_cls)
+    for enum_cls in (OrderSide, OrderType, TimeInForce)
+}
+
+
+def _upper(value: str) -> str:
+    """Upper-case an API string, memoizing the interned result"""
+    result = _UPPER_CACHE.get(value)
+    if result is None:
+        result = _UPPER_CACHE[value] = sys.intern(value.upper())
+    return result
+
+
+def _enum_value(value: Union[str, Enum], enum_cls: type) -> str:
+    """
+    Return the API string for an enum member or a case-insensitive string
+    
+    Args:
+        value: Enum member or string (e.g., OrderSide.BUY or 'buy')
+        enum_cls: Enum the value must belong to
+        
+    Returns:
+        The API string
+        
+    Raises:
+        ValueError: If the value is neither a member of enum_cls nor one of its values
+    """
+    if isinstance(value, enum_cls):
+        return value.value
+    if not isinstance(value, str):
+        raise ValueError(f"Invalid {enum_cls.__name__}: {value!r}")
+    result = _upper(value)
+    if result not in _ENUM_VALUES[enum_cls]:
+        raise ValueError(f"Invalid {enum_cls.__name__}: {value}")
+    return result
+
+
+def _encode_bool(value: Union[bool, str]) -> str:
+    """
+    Encode a boolean flag the way the API expects ('true'/'false')
+    
+    Args:
+        value: A bool, or the string 'true' or 'false' (any case)
+        
+    Returns:
+        'true' or 'false'
+        
+    Raises:
+        ValueError: If the value is neither a bool nor 'true'/'false'
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, str):
+        text = value.lower()
+        if text in ("true", "false"):
+            return text
+    raise ValueError(f"Invalid boolean flag: {value!r}")
+
+
+# Optional place_order arguments -> (API field name, value encoder or None)
+_ORDER_FIELDS = {
+    "quantity": ("quantity", None),
+    "price": ("price", None),
+    "time_in_force": ("timeInForce", lambda value: _enum_value(value, TimeInForce)),
+    "reduce_only": ("reduceOnly", _encode_bool),
+    "close_position": ("closePosition", _encode_bool),
+    "stop_price": ("stopPrice", None),
+    "working_type": ("workingType", _upper),
+    "price_protect": ("priceProtect", _encode_bool),
+    "new_order_resp_type": ("newOrderRespType", _upper),
+    "position_side": ("positionSide", _upper),
+}
+
+
+class BinanceAPIError(Exception):
+    """
+    Error response from the Binance API
+    
+    Attributes:
+        code: Binance error code (e.g., -1021 for a timestamp outside recvWindow), or None
+        msg: Error message returned by the API
+        http_status: HTTP status code
+        response: The raw HTTP response
+    """
+    __slots__ = ("code", "msg", "http_status", "response")
+    
+    def __init__(
+        self,
+        code: Optional[int],
+        msg: str,
+        http_status: int,
+        response: Optional[httpx.Response] = None
+    ):
+        super().__init__(code, msg, http_status)
+        self.code = code
+        self.msg = msg
+        self.http_status = http_status
+        self.response = response
+    
+    def __str__(self) -> str:
+        return f"HTTP Error {self.http_status}: {self.msg}"
 
 
 class BinanceFuturesBot:
@@ -50,7 +253,10 @@ class BinanceFuturesBot:
         api_key: str,
         api_secret: str,
         testnet: bool = False,
-        recv_window: int = 5000
+        recv_window: int = 5000,
+        timeout: float = 10,
+        exchange_info_ttl: float = 300.0,
+        request_weight_limit: int = 2400
     ):
         """
         Initialize the Binance Futures Bot
@@ -60,6 +266,10 @@ class BinanceFuturesBot:
             api_secret: Your Binance API secret
             testnet: Use testnet if True
             recv_window: Receive window for requests (default: 5000ms)
+            timeout: HTTP request timeout in seconds (default: 10)
+            exchange_info_ttl: Seconds to cache exchange information (default: 300)
+            request_weight_limit: Client-side request weight budget per minute (default: 2400).
+                At most a tenth of it can be spent in one burst
         """
         self.api_key = api_key
         self.api_secret = api_secret
@@ -67,31 +277,165 @@ class BinanceFuturesBot:
         self.recv_window = recv_window
         self.base_url = "https://demo-fapi.binance.com" if testnet else "https://fapi.binance.com"
         
-    def _generate_signature(self, query_string: str) -> str:
+        # Keyed HMAC state is computed once; each signature starts from a copy
+        self._api_key_bytes = api_key.encode('utf-8')
+        self._api_secret_bytes = api_secret.encode('utf-8')
+        self._hmac_template = hmac.new(self._api_secret_bytes, b'', _HMAC_DIGEST)
+        
+        # Constant per-client state, built once instead of on every request
+        self._signed_headers = MappingProxyType({"X-MBX-APIKEY": self._api_key_bytes})
+        self._url_cache: Dict[str, str] = {}
+        
+        # exchangeInfo is large and changes rarely, so it is cached and indexed by symbol
+        self._exchange_info_cache: Optional[Dict[str, Any]] = None
+        self._exchange_info_ts = 0.0
+        self._exchange_info_ttl = exchange_info_ttl
+        self._symbol_index: Dict[str, Dict[str, Any]] = {}
+        self._symbol_filters: Dict[str, Dict[str, Any]] = {}
+        
+        # Token bucket holding the request weight that may be spent right now;
+        # it refills continuously at request_weight_limit per minute and is
+        # capped at _WEIGHT_BURST_SECONDS of refill
+        self._req_limit = request_weight_limit
+        self._req_tokens = request_weight_limit * _WEIGHT_BURST_SECONDS / 60
+        self._last_refill = time.monotonic()
+        self._rate_lock = threading.Lock()
+        
+        # Optional push-based price source (see binance_futures_streams.PriceStream)
+        self._price_stream = None
+        
+        # Persistent HTTP/2 client: calls issued from several threads are
+        # multiplexed over one TLS connection instead of queueing behind each other
+        self._client = self._create_client(timeout)
+    
+    def _create_client(self, timeout: float) -> httpx.Client:
+        """
+        Create the HTTP client used for all API calls
+        
+        Args:
+            timeout: HTTP request timeout in seconds
+            
+        Returns:
+            Configured httpx client
+        """
+        return httpx.Client(
+            base_url=self.base_url,
+            headers=dict(self._signed_headers),
+            timeout=timeout,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                retries=3,
+            ),
+        )
+    
+    def close(self) -> None:
+        """
+        Close the underlying HTTP client and release pooled connections
+        """
+        self._client.close()
+    
+    def __enter__(self) -> "BinanceFuturesBot":
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+        
+    def _generate_signature(self, query_bytes: bytes) -> str:
         """
         Generate HMAC SHA256 signature for authenticated requests
         
         Args:
-            query_string: The query string to sign
+            query_bytes: The encoded query string to sign
             
         Returns:
             The signature as a hexadecimal string
         """
-        return hmac.new(
-            self.api_secret.encode('utf-8'),
-            query_string.encode('utf-8'),
-            hashlib.sha256
-        ).hexdigest()
+        h = self._hmac_template.copy()
+        h.update(query_bytes)
+        return h.hexdigest()
     
-    def _make_request(
+    def _reserve_weight(self, weight: int) -> float:
+        """
+        Take request weight from the token bucket
+        
+        The weight is always deducted, so concurrent callers queue up behind
+        each other instead of all waking at the same moment.
+        
+        Args:
+            weight: Request weight of the call
+            
+        Returns:
+            Seconds to wait before sending the request
+        """
+        with self._rate_lock:
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._last_refill = now
+            self._req_tokens = min(
+                self._req_limit * _WEIGHT_BURST_SECONDS / 60,
+                self._req_tokens + elapsed * self._req_limit / 60
+            )
+            self._req_tokens -= weight
+            if self._req_tokens >= 0:
+                return 0.0
+            return -self._req_tokens * 60 / self._req_limit
+    
+    def _sync_used_weight(self, response: httpx.Response) -> None:
+        """
+        Lower the token bucket to the weight Binance reports as left
+        
+        The X-MBX-USED-WEIGHT-1M header counts the weight used in the current
+        one-minute window, including requests made by other clients on the
+        same IP.
+        
+        Args:
+            response: HTTP response from the API
+        """
+        used = response.headers.get("X-MBX-USED-WEIGHT-1M")
+        if used is None:
+            return
+        try:
+            remaining = self._req_limit - int(used)
+        except ValueError:
+            return
+        with self._rate_lock:
+            self._req_tokens = min(self._req_tokens, remaining)
+    
+    def _acquire(self, weight: int = 1) -> None:
+        """
+        Block until the rate limiter allows a request of the given weight
+        
+        Args:
+            weight: Request weight of the call
+        """
+        delay = self._reserve_weight(weight)
+        if delay > 0:
+            time.sleep(delay)
+    
+    @staticmethod
+    def _timestamp_ms() -> int:
+        """
+        Current time in milliseconds for signed requests
+        
+        Uses integer nanoseconds, so no precision is lost through a float
+        intermediate. Calls within the same millisecond share a timestamp,
+        which Binance accepts.
+        
+        Returns:
+            Milliseconds since the epoch
+        """
+        return time.time_ns() // 1_000_000
+    
+    def _build_url(
         self,
         method: str,
         endpoint: str,
-        params: Optional[Dict[str, Any]] = None,
-        signed: bool = True
-    ) -> Dict[str, Any]:
+        params: Optional[Dict[str, Any]],
+        signed: bool
+    ) -> str:
         """
-        Make an HTTP request to the Binance API
+        Build the request URL, adding timestamp and signature for signed requests
         
         Args:
             method: HTTP method (GET, POST, DELETE, PUT)
@@ -100,58 +444,100 @@ class BinanceFuturesBot:
             signed: Whether the request requires authentication
             
         Returns:
-            JSON response from the API
-            
-        Raises:
-            Exception: If the API request fails
+            Absolute request URL
         """
+        if method not in ("GET", "POST", "DELETE", "PUT"):
+            raise ValueError(f"Unsupported HTTP method: {method}")
+        
         if params is None:
             params = {}
             
         # Add timestamp for signed requests
         if signed:
-            params['timestamp'] = int(time.time() * 1000)
+            params['timestamp'] = self._timestamp_ms()
             params['recvWindow'] = self.recv_window
         
-        # Create query string
-        query_string = urllib.parse.urlencode(params)
+        # Create query string exactly once. Percent-encoding (%20 rather than '+')
+        # is left untouched by httpx, so the signed bytes are the bytes sent.
+        query_string = _fast_urlencode(params)
         
         # Generate signature for signed requests
         if signed:
-            signature = self._generate_signature(query_string)
+            # The percent-encoded query is pure ASCII, so one C-level encode suffices
+            signature = self._generate_signature(query_string.encode('ascii'))
             query_string += f"&signature={signature}"
         
-        # Construct full URL
-        url = f"{self.base_url}{endpoint}?{query_string}" if query_string else f"{self.base_url}{endpoint}"
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = f"{self.base_url}{endpoint}"
         
-        # Set headers
-        headers = {"X-MBX-APIKEY": self.api_key}
+        # The query is passed in the URL, never via params=, so it is not re-encoded
+        return f"{url}?{query_string}" if query_string else url
+    
+    @staticmethod
+    def _parse_response(response: httpx.Response) -> Any:
+        """
+        Decode an API response, raising on HTTP error status
         
-        # Make the request
-        try:
-            if method == "GET":
-                response = requests.get(url, headers=headers, timeout=10)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, timeout=10)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=headers, timeout=10)
-            elif method == "PUT":
-                response = requests.put(url, headers=headers, timeout=10)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+        Args:
+            response: HTTP response from the API
             
-            response.raise_for_status()
-            return response.json()
+        Returns:
+            JSON response from the API
             
-        except requests.exceptions.HTTPError as e:
+        Raises:
+            BinanceAPIError: If the API returned an error status
+        """
+        status = response.status_code
+        if 200 <= status < 300:
+            return _json_loads(response.content)
+        
+        try:
+            error_data = _json_loads(response.content)
+        except ValueError:
+            error_data = None
+        if not isinstance(error_data, dict):
             error_data = {}
-            try:
-                error_data = response.json()
-            except:
-                error_data = {"msg": str(e)}
-            raise Exception(f"HTTP Error {response.status_code}: {error_data.get('msg', 'Unknown error')}")
-        except requests.exceptions.RequestException as e:
+        raise BinanceAPIError(
+            code=error_data.get("code"),
+            msg=error_data.get("msg") or response.reason_phrase or "Unknown error",
+            http_status=status,
+            response=response
+        )
+    
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        signed: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Make an HTTP request to the Binance API
+        
+        Args:
+            method: HTTP method (GET, POST, DELETE, PUT)
+            endpoint: API endpoint (e.g., '/fapi/v1/order')
+            params: Request parameters
+            signed: Whether the request requires authentication
+            
+        Returns:
+            JSON response from the API
+            
+        Raises:
+            BinanceAPIError: If the API returned an error status
+            Exception: If the request could not be sent
+        """
+        self._acquire(_request_weight(method, endpoint, params))
+        url = self._build_url(method, endpoint, params, signed)
+        
+        # Make the request (API key header is attached to the client)
+        try:
+            response = self._client.request(method, url)
+        except httpx.HTTPError as e:
             raise Exception(f"Request failed: {str(e)}")
+        self._sync_used_weight(response)
+        return self._parse_response(response)
     
     def get_account_info(self) -> Dict[str, Any]:
         """
@@ -192,14 +578,79 @@ class BinanceFuturesBot:
             params["symbol"] = symbol
         return self._make_request("GET", "/fapi/v2/positionRisk", params)
     
-    def get_exchange_info(self) -> Dict[str, Any]:
+    def _cached_exchange_info(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached exchange information if it is still within its TTL
+        """
+        if time.monotonic() - self._exchange_info_ts < self._exchange_info_ttl:
+            return self._exchange_info_cache
+        return None
+    
+    @staticmethod
+    def _parse_symbol_filters(symbol_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract precision and tick/step sizes from a symbol's exchange information
+        
+        Args:
+            symbol_info: One entry of exchangeInfo['symbols']
+            
+        Returns:
+            Dictionary with pricePrecision, quantityPrecision, tickSize and stepSize
+        """
+        filters = {f["filterType"]: f for f in symbol_info.get("filters", [])}
+        tick_size = filters.get("PRICE_FILTER", {}).get("tickSize")
+        step_size = filters.get("LOT_SIZE", {}).get("stepSize")
+        return {
+            "pricePrecision": symbol_info.get("pricePrecision"),
+            "quantityPrecision": symbol_info.get("quantityPrecision"),
+            "tickSize": Decimal(tick_size) if tick_size is not None else None,
+            "stepSize": Decimal(step_size) if step_size is not None else None,
+        }
+    
+    def _store_exchange_info(self, exchange_info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Cache exchange information and rebuild the symbol index
+        
+        Args:
+            exchange_info: Response of /fapi/v1/exchangeInfo
+            
+        Returns:
+            The same exchange information
+        """
+        self._symbol_index = {s["symbol"]: s for s in exchange_info.get("symbols", [])}
+        self._symbol_filters = {
+            symbol: self._parse_symbol_filters(info)
+            for symbol, info in self._symbol_index.items()
+        }
+        for rate_limit in exchange_info.get("rateLimits", []):
+            if (rate_limit.get("rateLimitType") == "REQUEST_WEIGHT"
+                    and rate_limit.get("interval") == "MINUTE"):
+                per_minute = rate_limit["limit"] / rate_limit.get("intervalNum", 1)
+                with self._rate_lock:
+                    self._req_limit = min(self._req_limit, per_minute)
+        self._exchange_info_cache = exchange_info
+        self._exchange_info_ts = time.monotonic()
+        return exchange_info
+    
+    def get_exchange_info(self, force_refresh: bool = False) -> Dict[str, Any]:
         """
         Get exchange trading rules and symbol information
         
+        The response is cached for exchange_info_ttl seconds.
+        
+        Args:
+            force_refresh: Bypass the cache and fetch fresh data
+            
         Returns:
             Exchange information including symbols, filters, rate limits, etc.
         """
-        return self._make_request("GET", "/fapi/v1/exchangeInfo", signed=False)
+        if not force_refresh:
+            exchange_info = self._cached_exchange_info()
+            if exchange_info is not None:
+                return exchange_info
+        return self._store_exchange_info(
+            self._make_request("GET", "/fapi/v1/exchangeInfo", signed=False)
+        )
     
     def get_symbol_info(self, symbol: str) -> Optional[Dict[str, Any]]:
         """
@@ -211,40 +662,131 @@ class BinanceFuturesBot:
         Returns:
             Symbol information or None if not found
         """
-        exchange_info = self.get_exchange_info()
-        for s in exchange_info.get("symbols", []):
-            if s["symbol"] == symbol:
-                return s
-        return None
+        self.get_exchange_info()
+        return self._symbol_index.get(_upper(symbol))
+    
+    def get_symbol_filters(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get pre-parsed trading rules for a symbol
+        
+        Useful for rounding price and quantity before place_order without
+        walking the symbol's filter list on every call.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            
+        Returns:
+            Dictionary with pricePrecision and quantityPrecision (int) and
+            tickSize and stepSize (Decimal), or None if the symbol is not found
+        """
+        self.get_exchange_info()
+        return self._symbol_filters.get(_upper(symbol))
+    
+    def attach_price_stream(self, price_stream) -> None:
+        """
+        Serve get_current_price from a WebSocket price stream when it is fresh
+        
+        Args:
+            price_stream: A started binance_futures_streams.PriceStream, or None to detach
+        """
+        self._price_stream = price_stream
     
     def get_current_price(self, symbol: str) -> float:
         """
         Get current market price for a symbol
         
+        Uses the attached price stream if it has a fresh price, otherwise REST.
+        
         Args:
             symbol: Trading pair symbol (e.g., 'BTCUSDT')
             
         Returns:
             Current price as float
         """
+        if self._price_stream is not None:
+            price = self._price_stream.get_price(symbol)
+            if price is not None:
+                return price
+        
         endpoint = "/fapi/v1/ticker/price"
         params = {"symbol": symbol}
         response = self._make_request("GET", endpoint, params, signed=False)
         return float(response["price"])
     
+    @staticmethod
+    def _build_order_params(
+        symbol: str,
+        side: Union[str, OrderSide],
+        order_type: Union[str, OrderType],
+        **fields: Any
+    ) -> Dict[str, Any]:
+        """
+        Build API parameters for an order from place_order keyword arguments
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            side: Order side - 'BUY' or 'SELL'
+            order_type: Order type - 'MARKET', 'LIMIT', 'STOP', etc.
+            **fields: Optional place_order arguments; None values are skipped
+            
+        Returns:
+            Order parameters keyed by API field name
+            
+        Raises:
+            ValueError: If side, order_type or time_in_force is not a valid value
+        """
+        params = {
+            "symbol": _upper(symbol),
+            "side": _enum_value(side, OrderSide),
+            "type": _enum_value(order_type, OrderType),
+        }
+        for name, value in fields.items():
+            if value is not None:
+                key, encode = _ORDER_FIELDS[name]
+                params[key] = encode(value) if encode is not None else value
+        return params
+    
+    def _post_market_order(self, side: str, symbol: str, quantity: float) -> Dict[str, Any]:
+        """
+        Send a market order with a fixed parameter layout
+        """
+        params = {"symbol": _upper(symbol), "side": side, "type": "MARKET", "quantity": quantity}
+        return self._make_request("POST", "/fapi/v1/order", params)
+    
+    def _post_limit_order(
+        self,
+        side: str,
+        symbol: str,
+        quantity: float,
+        price: float,
+        time_in_force: Union[str, TimeInForce]
+    ) -> Dict[str, Any]:
+        """
+        Send a limit order with a fixed parameter layout
+        """
+        params = {
+            "symbol": _upper(symbol),
+            "side": side,
+            "type": "LIMIT",
+            "quantity": quantity,
+            "price": price,
+            "timeInForce": _enum_value(time_in_force, TimeInForce),
+        }
+        return self._make_request("POST", "/fapi/v1/order", params)
+    
     def place_order(
         self,
         symbol: str,
-        side: str,
-        order_type: str,
+        side: Union[str, OrderSide],
+        order_type: Union[str, OrderType],
         quantity: Optional[float] = None,
         price: Optional[float] = None,
-        time_in_force: Optional[str] = None,
-        reduce_only: Optional[bool] = None,
-        close_position: Optional[bool] = None,
+        time_in_force: Optional[Union[str, TimeInForce]] = None,
+        reduce_only: Optional[Union[bool, str]] = None,
+        close_position: Optional[Union[bool, str]] = None,
         stop_price: Optional[float] = None,
         working_type: Optional[str] = None,
-        price_protect: Optional[bool] = None,
+        price_protect: Optional[Union[bool, str]] = None,
         new_order_resp_type: Optional[str] = None,
         position_side: Optional[str] = None,
     ) -> Dict[str, Any]:
@@ -253,22 +795,25 @@ class BinanceFuturesBot:
         
         Args:
             symbol: Trading pair symbol (e.g., 'BTCUSDT')
-            side: Order side - 'BUY' or 'SELL'
-            order_type: Order type - 'MARKET', 'LIMIT', 'STOP', etc.
+            side: Order side - 'BUY' or 'SELL', or an OrderSide
+            order_type: Order type - 'MARKET', 'LIMIT', 'STOP', etc., or an OrderType
             quantity: Order quantity (required for most order types)
             price: Order price (required for LIMIT orders)
-            time_in_force: Time in force - 'GTC', 'IOC', 'FOK', 'GTX' (required for LIMIT orders)
-            reduce_only: 'true' or 'false'. Used with Hedge Mode. If 'true', the order can only reduce position
-            close_position: If 'true', close all positions for the symbol
+            time_in_force: Time in force - 'GTC', 'IOC', 'FOK', 'GTX', 'GTD', or a TimeInForce (required for LIMIT orders)
+            reduce_only: True/False or 'true'/'false'. Used with Hedge Mode. If true, the order can only reduce position
+            close_position: True/False or 'true'/'false'. If true, close all positions for the symbol
             stop_price: Used with STOP/STOP_MARKET orders
             working_type: 'MARK_PRICE' or 'CONTRACT_PRICE' (for conditional orders)
-            price_protect: 'true' or 'false' - for stop orders
+            price_protect: True/False or 'true'/'false' - for stop orders
             new_order_resp_type: 'ACK', 'RESULT', 'FULL'
             position_side: 'BOTH', 'LONG', or 'SHORT' (for Hedge Mode)
             
         Returns:
             Order response dictionary
             
+        Raises:
+            ValueError: If side, order_type, time_in_force or a boolean flag is not a valid value
+            
         Example:
             # Market buy order
             bot.place_order(
@@ -288,35 +833,64 @@ class BinanceFuturesBot:
                 time_in_force="GTC"
             )
         """
-        params = {
-            "symbol": symbol.upper(),
-            "side": side.upper(),
-            "type": order_type.upper(),
-        }
+        params = self._build_order_params(
+            symbol,
+            side,
+            order_type,
+            quantity=quantity,
+            price=price,
+            time_in_force=time_in_force,
+            reduce_only=reduce_only,
+            close_position=close_position,
+            stop_price=stop_price,
+            working_type=working_type,
+            price_protect=price_protect,
+            new_order_resp_type=new_order_resp_type,
+            position_side=position_side,
+        )
+        return self._make_request("POST", "/fapi/v1/order", params)
+    
+    def place_orders(
+        self,
+        orders: List[Dict[str, Any]],
+        max_workers: int = 16
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Place several orders in parallel
         
-        # Add optional parameters
-        if quantity is not None:
-            params["quantity"] = quantity
-        if price is not None:
-            params["price"] = price
-        if time_in_force is not None:
-            params["timeInForce"] = time_in_force.upper()
-        if reduce_only is not None:
-            params["reduceOnly"] = str(reduce_only).lower()
-        if close_position is not None:
-            params["closePosition"] = str(close_position).lower()
-        if stop_price is not None:
-            params["stopPrice"] = stop_price
-        if working_type is not None:
-            params["workingType"] = working_type.upper()
-        if price_protect is not None:
-            params["priceProtect"] = str(price_protect).lower()
-        if new_order_resp_type is not None:
-            params["newOrderRespType"] = new_order_resp_type.upper()
-        if position_side is not None:
-            params["positionSide"] = position_side.upper()
+        Orders are sent from a thread pool, so the total time is close to one
+        round-trip rather than one per order. The rate limiter still applies.
         
-        return self._make_request("POST", "/fapi/v1/order", params)
+        Args:
+            orders: List of keyword-argument dicts for place_order
+            max_workers: Maximum number of orders in flight (default: 16)
+            
+        Returns:
+            One entry per order, in input order: the order response, or the
+            exception raised for that order
+            
+        Example:
+            results = bot.place_orders([
+                {"symbol": "BTCUSDT", "side": "BUY", "order_type": "MARKET", "quantity": 0.001},
+                {"symbol": "ETHUSDT", "side": "BUY", "order_type": "MARKET", "quantity": 0.01},
+            ])
+        """
+        if not orders:
+            return []
+        
+        results: List[Union[Dict[str, Any], Exception]] = [None] * len(orders)
+        with ThreadPoolExecutor(max_workers=min(len(orders), max_workers)) as executor:
+            futures = {
+                executor.submit(self.place_order, **order): index
+                for index, order in enumerate(orders)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    results[index] = e
+        return results
     
     def cancel_order(
         self,
@@ -335,7 +909,7 @@ class BinanceFuturesBot:
         Returns:
             Cancellation response
         """
-        params = {"symbol": symbol.upper()}
+        params = {"symbol": _upper(symbol)}
         if order_id is not None:
             params["orderId"] = order_id
         elif orig_client_order_id is not None:
@@ -345,6 +919,152 @@ class BinanceFuturesBot:
         
         return self._make_request("DELETE", "/fapi/v1/order", params)
     
+    @staticmethod
+    def _batch_cancel_params(
+        symbol: str,
+        order_ids: Optional[Iterable[int]],
+        orig_client_order_ids: Optional[Iterable[str]]
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Split a cancellation into batchOrders requests of at most 10 orders
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            order_ids: Order IDs to cancel
+            orig_client_order_ids: Original client order IDs to cancel
+            
+        Returns:
+            Iterator of (number of orders, request parameters), one per batch
+        """
+        if order_ids is not None:
+            key, ids = "orderIdList", list(order_ids)
+        elif orig_client_order_ids is not None:
+            key, ids = "origClientOrderIdList", list(orig_client_order_ids)
+        else:
+            raise ValueError("Either order_ids or orig_client_order_ids must be provided")
+        
+        for start in range(0, len(ids), _BATCH_CANCEL_SIZE):
+            batch = ids[start:start + _BATCH_CANCEL_SIZE]
+            yield len(batch), {
+                "symbol": _upper(symbol),
+                key: json.dumps(batch, separators=(",", ":")),
+            }
+    
+    def cancel_orders(
+        self,
+        symbol: str,
+        order_ids: Optional[Iterable[int]] = None,
+        orig_client_order_ids: Optional[Iterable[str]] = None
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Cancel several orders with batch requests (up to 10 orders per request)
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            order_ids: Order IDs (either order_ids or orig_client_order_ids must be provided)
+            orig_client_order_ids: Original client order IDs
+            
+        Returns:
+            One cancellation response per order, in input order; failed
+            cancellations are returned as {'code': ..., 'msg': ...}, and the
+            orders of a batch whose request failed get that exception
+        """
+        return self._send_batches(
+            "DELETE", self._batch_cancel_params(symbol, order_ids, orig_client_order_ids)
+        )
+    
+    @classmethod
+    def _batch_place_params(cls, orders: List[Dict[str, Any]]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Split orders into batchOrders requests of at most 5 orders
+        
+        Args:
+            orders: List of keyword-argument dicts for place_order
+            
+        Returns:
+            Iterator of (number of orders, request parameters), one per batch
+        """
+        # The batch endpoint expects every order field as a string
+        encoded = [
+            {key: str(value) for key, value in cls._build_order_params(**order).items()}
+            for order in orders
+        ]
+        for start in range(0, len(encoded), _BATCH_PLACE_SIZE):
+            batch = encoded[start:start + _BATCH_PLACE_SIZE]
+            yield len(batch), {"batchOrders": json.dumps(batch, separators=(",", ":"))}
+    
+    @staticmethod
+    def _flatten_batch_results(
+        sizes: List[int],
+        batches: List[Union[list, Exception]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Flatten per-batch responses into one entry per order
+        
+        A batch whose request failed contributes its exception once for each
+        of its orders, so the result stays aligned with the input.
+        
+        Args:
+            sizes: Number of orders in each batch
+            batches: Response list or raised exception for each batch
+            
+        Returns:
+            One entry per order, in input order
+        """
+        results: List[Union[Dict[str, Any], Exception]] = []
+        for size, batch in zip(sizes, batches):
+            if isinstance(batch, Exception):
+                results.extend([batch] * size)
+            else:
+                results.extend(batch)
+        return results
+    
+    def _send_batches(
+        self,
+        method: str,
+        batches: Iterator[Tuple[int, Dict[str, Any]]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Send batchOrders requests one after another, keeping failures in place
+        
+        Args:
+            method: HTTP method (POST or DELETE)
+            batches: (number of orders, request parameters) per batch
+            
+        Returns:
+            One entry per order, in input order
+        """
+        sizes, responses = [], []
+        for size, params in batches:
+            sizes.append(size)
+            try:
+                responses.append(self._make_request(method, "/fapi/v1/batchOrders", params))
+            except Exception as e:
+                responses.append(e)
+        return self._flatten_batch_results(sizes, responses)
+    
+    def place_orders_batch(self, orders: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Place several orders with batch requests (up to 5 orders per request)
+        
+        Args:
+            orders: List of keyword-argument dicts for place_order
+            
+        Returns:
+            One order response per order, in input order; rejected orders are
+            returned as {'code': ..., 'msg': ...}, and the orders of a batch
+            whose request failed get that exception
+            
+        Example:
+            bot.place_orders_batch([
+                {"symbol": "BTCUSDT", "side": "BUY", "order_type": "LIMIT",
+                 "quantity": 0.001, "price": 49000.0, "time_in_force": "GTC"},
+                {"symbol": "BTCUSDT", "side": "BUY", "order_type": "LIMIT",
+                 "quantity": 0.001, "price": 48000.0, "time_in_force": "GTC"},
+            ])
+        """
+        return self._send_batches("POST", self._batch_place_params(orders))
+    
     def cancel_all_orders(self, symbol: str) -> Dict[str, Any]:
         """
         Cancel all active orders for a symbol
@@ -355,7 +1075,7 @@ class BinanceFuturesBot:
         Returns:
             Cancellation response
         """
-        params = {"symbol": symbol.upper()}
+        params = {"symbol": _upper(symbol)}
         return self._make_request("DELETE", "/fapi/v1/allOpenOrders", params)
     
     def get_order_status(
@@ -375,7 +1095,7 @@ class BinanceFuturesBot:
         Returns:
             Order status information
         """
-        params = {"symbol": symbol.upper()}
+        params = {"symbol": _upper(symbol)}
         if order_id is not None:
             params["orderId"] = order_id
         elif orig_client_order_id is not None:
@@ -397,9 +1117,36 @@ class BinanceFuturesBot:
         """
         params = {}
         if symbol:
-            params["symbol"] = symbol.upper()
+            params["symbol"] = _upper(symbol)
         return self._make_request("GET", "/fapi/v1/openOrders", params)
     
+    def start_user_stream(self) -> Dict[str, Any]:
+        """
+        Create (or return the active) listen key for the user data stream
+        
+        Returns:
+            Dictionary with the 'listenKey'
+        """
+        return self._make_request("POST", "/fapi/v1/listenKey", signed=False)
+    
+    def keepalive_user_stream(self) -> Dict[str, Any]:
+        """
+        Extend the validity of the listen key by 60 minutes
+        
+        Returns:
+            Empty dictionary on success
+        """
+        return self._make_request("PUT", "/fapi/v1/listenKey", signed=False)
+    
+    def close_user_stream(self) -> Dict[str, Any]:
+        """
+        Close the user data stream
+        
+        Returns:
+            Empty dictionary on success
+        """
+        return self._make_request("DELETE", "/fapi/v1/listenKey", signed=False)
+    
     def buy_market(
         self,
         symbol: str,
@@ -415,12 +1162,7 @@ class BinanceFuturesBot:
         Returns:
             Order response
         """
-        return self.place_order(
-            symbol=symbol,
-            side="BUY",
-            order_type="MARKET",
-            quantity=quantity
-        )
+        return self._post_market_order("BUY", symbol, quantity)
     
     def sell_market(
         self,
@@ -437,19 +1179,14 @@ class BinanceFuturesBot:
         Returns:
             Order response
         """
-        return self.place_order(
-            symbol=symbol,
-            side="SELL",
-            order_type="MARKET",
-            quantity=quantity
-        )
+        return self._post_market_order("SELL", symbol, quantity)
     
     def buy_limit(
         self,
         symbol: str,
         quantity: float,
         price: float,
-        time_in_force: str = "GTC"
+        time_in_force: Union[str, TimeInForce] = "GTC"
     ) -> Dict[str, Any]:
         """
         Place a limit buy order (convenience method)
@@ -463,21 +1200,14 @@ class BinanceFuturesBot:
         Returns:
             Order response
         """
-        return self.place_order(
-            symbol=symbol,
-            side="BUY",
-            order_type="LIMIT",
-            quantity=quantity,
-            price=price,
-            time_in_force=time_in_force
-        )
+        return self._post_limit_order("BUY", symbol, quantity, price, time_in_force)
     
     def sell_limit(
         self,
         symbol: str,
         quantity: float,
         price: float,
-        time_in_force: str = "GTC"
+        time_in_force: Union[str, TimeInForce] = "GTC"
     ) -> Dict[str, Any]:
         """
         Place a limit sell order (convenience method)
@@ -491,12 +1221,313 @@ class BinanceFuturesBot:
         Returns:
             Order response
         """
-        return self.place_order(
-            symbol=symbol,
-            side="SELL",
-            order_type="LIMIT",
-            quantity=quantity,
-            price=price,
-            time_in_force=time_in_force
-        )
+        return self._post_limit_order("SELL", symbol, quantity, price, time_in_force)
+
+
 
+class AsyncBinanceFuturesBot(BinanceFuturesBot):
+    """
+    Asynchronous Binance USDⓈ-M Futures Trading Bot
+    
+    Mirrors the BinanceFuturesBot API, but every API method is a coroutine.
+    Independent calls can be issued concurrently, e.g. with asyncio.gather,
+    and are multiplexed over a single HTTP/2 connection.
+    
+    Example:
+        async with AsyncBinanceFuturesBot(api_key, api_secret, testnet=True) as bot:
+            balance, price = await asyncio.gather(
+                bot.get_balance(),
+                bot.get_current_price("BTCUSDT")
+            )
+    """
+    
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize the asynchronous bot (same arguments as BinanceFuturesBot)
+        """
+        super().__init__(*args, **kwargs)
+        
+        # Pending unsigned GETs keyed by endpoint and parameters; identical
+        # concurrent calls await the same task instead of issuing a new request
+        self._inflight: Dict[Tuple[str, Any], asyncio.Task] = {}
+    
+    def _create_client(self, timeout: float) -> httpx.AsyncClient:
+        """
+        Create the asynchronous HTTP client used for all API calls
+        
+        Args:
+            timeout: HTTP request timeout in seconds
+            
+        Returns:
+            Configured httpx async client
+        """
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=dict(self._signed_headers),
+            timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                retries=3,
+            ),
+        )
+    
+    async def close(self) -> None:
+        """
+        Close the underlying HTTP client and release pooled connections
+        """
+        await self._client.aclose()
+    
+    async def __aenter__(self) -> "AsyncBinanceFuturesBot":
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+    
+    def __enter__(self):
+        raise TypeError("Use 'async with' with AsyncBinanceFuturesBot")
+    
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        signed: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Make an asynchronous HTTP request to the Binance API
+        
+        Args:
+            method: HTTP method (GET, POST, DELETE, PUT)
+            endpoint: API endpoint (e.g., '/fapi/v1/order')
+            params: Request parameters
+            signed: Whether the request requires authentication
+            
+        Returns:
+            JSON response from the API
+            
+        Raises:
+            BinanceAPIError: If the API returned an error status
+            Exception: If the request could not be sent
+        """
+        if signed or method != "GET":
+            return await self._send_request(method, endpoint, params, signed)
+        
+        key = (endpoint, frozenset(params.items()) if params else None)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._send_request(method, endpoint, params, signed))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._finish_inflight(key, t))
+        # Shield so one cancelled caller does not cancel the request for the others
+        return await asyncio.shield(task)
+    
+    async def _acquire(self, weight: int = 1) -> None:
+        """
+        Wait until the rate limiter allows a request of the given weight
+        
+        Args:
+            weight: Request weight of the call
+        """
+        delay = self._reserve_weight(weight)
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def _finish_inflight(self, key: Tuple[str, Any], task: asyncio.Task) -> None:
+        """
+        Forget a completed in-flight request
+        """
+        self._inflight.pop(key, None)
+        # Mark the exception as retrieved in case every waiter was cancelled
+        if not task.cancelled():
+            task.exception()
+    
+    async def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        signed: bool
+    ) -> Dict[str, Any]:
+        """
+        Send a single HTTP request to the Binance API
+        """
+        await self._acquire(_request_weight(method, endpoint, params))
+        url = self._build_url(method, endpoint, params, signed)
+        
+        try:
+            response = await self._client.request(method, url)
+        except httpx.HTTPError as e:
+            raise Exception(f"Request failed: {str(e)}")
+        self._sync_used_weight(response)
+        return self._parse_response(response)
+    
+    # Methods that only forward to _make_request are inherited unchanged and
+    # return awaitables; the ones below post-process the response.
+    
+    async def get_balance(self) -> Dict[str, Any]:
+        """
+        Get account balance
+        
+        Returns:
+            Dictionary with account balance information
+        """
+        account_info = await self.get_account_info()
+        return {
+            "total_wallet_balance": account_info.get("totalWalletBalance"),
+            "total_unrealized_profit": account_info.get("totalUnrealizedProfit"),
+            "available_balance": account_info.get("availableBalance"),
+            "assets": account_info.get("assets", [])
+        }
+    
+    async def get_exchange_info(self, force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Get exchange trading rules and symbol information
+        
+        The response is cached for exchange_info_ttl seconds.
+        
+        Args:
+            force_refresh: Bypass the cache and fetch fresh data
+            
+        Returns:
+            Exchange information including symbols, filters, rate limits, etc.
+        """
+        if not force_refresh:
+            exchange_info = self._cached_exchange_info()
+            if exchange_info is not None:
+                return exchange_info
+        return self._store_exchange_info(
+            await self._make_request("GET", "/fapi/v1/exchangeInfo", signed=False)
+        )
+    
+    async def get_symbol_info(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get information about a specific trading symbol
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            
+        Returns:
+            Symbol information or None if not found
+        """
+        await self.get_exchange_info()
+        return self._symbol_index.get(_upper(symbol))
+    
+    async def get_symbol_filters(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Get pre-parsed trading rules for a symbol
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            
+        Returns:
+            Dictionary with pricePrecision and quantityPrecision (int) and
+            tickSize and stepSize (Decimal), or None if the symbol is not found
+        """
+        await self.get_exchange_info()
+        return self._symbol_filters.get(_upper(symbol))
+    
+    async def cancel_orders(
+        self,
+        symbol: str,
+        order_ids: Optional[Iterable[int]] = None,
+        orig_client_order_ids: Optional[Iterable[str]] = None
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Cancel several orders with concurrent batch requests (up to 10 orders per request)
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            order_ids: Order IDs (either order_ids or orig_client_order_ids must be provided)
+            orig_client_order_ids: Original client order IDs
+            
+        Returns:
+            One cancellation response per order, in input order; failed
+            cancellations are returned as {'code': ..., 'msg': ...}, and the
+            orders of a batch whose request failed get that exception
+        """
+        return await self._send_batches(
+            "DELETE", self._batch_cancel_params(symbol, order_ids, orig_client_order_ids)
+        )
+    
+    async def place_orders_batch(self, orders: List[Dict[str, Any]]) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Place several orders with concurrent batch requests (up to 5 orders per request)
+        
+        Args:
+            orders: List of keyword-argument dicts for place_order
+            
+        Returns:
+            One order response per order, in input order; rejected orders are
+            returned as {'code': ..., 'msg': ...}, and the orders of a batch
+            whose request failed get that exception
+        """
+        return await self._send_batches("POST", self._batch_place_params(orders))
+    
+    async def _send_batches(
+        self,
+        method: str,
+        batches: Iterator[Tuple[int, Dict[str, Any]]]
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Send batchOrders requests concurrently, keeping failures in place
+        
+        Args:
+            method: HTTP method (POST or DELETE)
+            batches: (number of orders, request parameters) per batch
+            
+        Returns:
+            One entry per order, in input order
+        """
+        sizes, requests = [], []
+        for size, params in batches:
+            sizes.append(size)
+            requests.append(self._make_request(method, "/fapi/v1/batchOrders", params))
+        responses = await asyncio.gather(*requests, return_exceptions=True)
+        return self._flatten_batch_results(sizes, responses)
+    
+    async def place_orders(
+        self,
+        orders: List[Dict[str, Any]],
+        max_workers: int = 16
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Place several orders concurrently
+        
+        Args:
+            orders: List of keyword-argument dicts for place_order
+            max_workers: Maximum number of orders in flight (default: 16)
+            
+        Returns:
+            One entry per order, in input order: the order response, or the
+            exception raised for that order
+        """
+        semaphore = asyncio.Semaphore(max_workers)
+        
+        async def _place(order: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.place_order(**order)
+        
+        return await asyncio.gather(*(_place(order) for order in orders), return_exceptions=True)
+    
+    async def get_current_price(self, symbol: str) -> float:
+        """
+        Get current market price for a symbol
+        
+        Uses the attached price stream if it has a fresh price, otherwise REST.
+        
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT')
+            
+        Returns:
+            Current price as float
+        """
+        if self._price_stream is not None:
+            price = self._price_stream.get_price(symbol)
+            if price is not None:
+                return price
+        
+        endpoint = "/fapi/v1/ticker/price"
+        params = {"symbol": symbol}
+        response = await self._make_request("GET", endpoint, params, signed=False)
+        return float(response["price"])
@@ -0,0 +1,407 @@
+"""
+Binance USDⓈ-M Futures WebSocket Streams
+Push-based market data so trading loops do not have to poll the REST API.
+"""
+
+import asyncio
+import json
+import logging
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import websockets
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+logger = logging.getLogger(__name__)
+
+STREAM_URL = "wss://fstream.binance.com"
+TESTNET_STREAM_URL = "wss://fstream.binancefuture.com"
+
+
+class _Stream(ABC):
+    """
+    Lifecycle shared by all streams: run as a task or on a background thread
+    """
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @abstractmethod
+    async def run(self) -> None:
+        """
+        Consume the stream until cancelled
+        """
+
+    def start(self) -> asyncio.Task:
+        """
+        Run the stream as a task on the current event loop
+
+        Returns:
+            The background task
+        """
+        self._loop = asyncio.get_running_loop()
+        self._task = self._loop.create_task(self.run())
+        return self._task
+
+    def start_in_thread(self) -> threading.Thread:
+        """
+        Run the stream on its own event loop in a daemon thread (for sync bots)
+
+        Returns:
+            The background thread
+        """
+        self._loop = asyncio.new_event_loop()
+        self._task = self._loop.create_task(self.run())
+
+        def _run() -> None:
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._loop.run_until_complete(self._task)
+            except asyncio.CancelledError:
+                pass
+            finally:
+                self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+                self._loop.close()
+
+        self._thread = threading.Thread(target=_run, name=type(self).__name__, daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        """
+        Stop the stream started with start() or start_in_thread()
+        """
+        if self._task is None:
+            return
+        if self._thread is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._task.cancel)
+            except RuntimeError:
+                # run() already ended and the thread closed its loop
+                pass
+            self._thread.join()
+            self._thread = None
+        else:
+            self._task.cancel()
+        self._task = None
+
+
+class PriceStream(_Stream):
+    """
+    Latest traded price per symbol from the miniTicker market stream
+
+    One WebSocket connection delivers every update for all subscribed symbols.
+    Attach the stream to a bot with attach_price_stream() and get_current_price()
+    answers from it, falling back to REST when the price is stale.
+
+    Example:
+        stream = PriceStream(["BTCUSDT", "ETHUSDT"], testnet=True)
+        stream.start_in_thread()      # sync bots
+        # stream.start()              # inside a running event loop
+        bot.attach_price_stream(stream)
+    """
+
+    def __init__(
+        self,
+        symbols: Iterable[str],
+        testnet: bool = False,
+        max_age: float = 1.0
+    ):
+        """
+        Initialize the price stream
+
+        Args:
+            symbols: Trading pair symbols to subscribe to (e.g., ['BTCUSDT'])
+            testnet: Use the testnet stream if True
+            max_age: Seconds after which a streamed price is considered stale (default: 1.0)
+        """
+        super().__init__()
+        self.symbols = [symbol.upper() for symbol in symbols]
+        self.max_age = max_age
+        base_url = TESTNET_STREAM_URL if testnet else STREAM_URL
+        streams = "/".join(f"{symbol.lower()}@miniTicker" for symbol in self.symbols)
+        self.url = f"{base_url}/stream?streams={streams}"
+
+        self._last_prices: Dict[str, float] = {}
+        self._last_update: Dict[str, float] = {}
+
+    def get_price(self, symbol: str) -> Optional[float]:
+        """
+        Get the latest streamed price for a symbol
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTCUSDT'), case-insensitive
+
+        Returns:
+            Price as float, or None if not subscribed or older than max_age
+        """
+        symbol = symbol.upper()
+        updated = self._last_update.get(symbol)
+        if updated is None or time.monotonic() - updated > self.max_age:
+            return None
+        return self._last_prices.get(symbol)
+
+    def _handle_message(self, message: str) -> None:
+        """
+        Record the price carried by a combined-stream miniTicker message
+        """
+        data = _json_loads(message).get("data", {})
+        if data.get("e") == "24hrMiniTicker":
+            symbol = data["s"]
+            self._last_prices[symbol] = float(data["c"])
+            self._last_update[symbol] = time.monotonic()
+
+    async def run(self) -> None:
+        """
+        Consume the stream until cancelled, reconnecting when the connection drops
+        """
+        async for websocket in websockets.connect(self.url):
+            async with websocket:
+                try:
+                    async for message in websocket:
+                        try:
+                            self._handle_message(message)
+                        except (ValueError, KeyError, TypeError):
+                            # One malformed message must not end the stream
+                            logger.warning("Skipping malformed price stream message", exc_info=True)
+                except websockets.ConnectionClosed:
+                    continue
+
+
+class UserDataStream(_Stream):
+    """
+    Account and order events pushed over the user data stream
+
+    Replaces polling get_order_status/get_open_orders: ORDER_TRADE_UPDATE and
+    ACCOUNT_UPDATE events are dispatched to callbacks as soon as they happen,
+    without spending request weight. The listen key is created through the
+    bot and kept alive every 30 minutes.
+
+    Example:
+        stream = UserDataStream(bot, testnet=True)
+        stream.add_callback("ORDER_TRADE_UPDATE", lambda event: print(event["o"]["X"]))
+        stream.start_in_thread()
+        stream.wait_until_connected(timeout=10)
+        order = bot.buy_market("BTCUSDT", 0.001)
+        fill = stream.wait_for_fill(order["orderId"], timeout=10)
+    """
+
+    KEEPALIVE_INTERVAL = 30 * 60
+
+    # Number of recent fills remembered for await_fill calls made after the event
+    FILL_HISTORY = 1000
+
+    def __init__(self, bot, testnet: Optional[bool] = None, reconnect_delay: float = 1.0):
+        """
+        Initialize the user data stream
+
+        Args:
+            bot: BinanceFuturesBot or AsyncBinanceFuturesBot used to manage the listen key
+            testnet: Use the testnet stream if True (default: same as the bot)
+            reconnect_delay: Seconds to wait before reconnecting after an error (default: 1.0)
+        """
+        super().__init__()
+        self._bot = bot
+        if testnet is None:
+            testnet = bot.testnet
+        self._base_url = TESTNET_STREAM_URL if testnet else STREAM_URL
+        self.reconnect_delay = reconnect_delay
+        self.listen_key: Optional[str] = None
+
+        self._callbacks: Dict[str, List[Callable[[Dict[str, Any]], Any]]] = {}
+        self._fills: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._fill_waiters: Dict[int, List[asyncio.Event]] = {}
+        # Created on the stream's loop by _connected_event()
+        self._connected: Optional[asyncio.Event] = None
+
+    def add_callback(self, event_type: str, callback: Callable[[Dict[str, Any]], Any]) -> None:
+        """
+        Register a callback for an event type
+
+        Args:
+            event_type: Event name, e.g. 'ORDER_TRADE_UPDATE' or 'ACCOUNT_UPDATE'
+            callback: Called with the decoded event; may be a coroutine function.
+                Exceptions raised by the callback are logged and otherwise ignored.
+        """
+        self._callbacks.setdefault(event_type, []).append(callback)
+
+    def _connected_event(self) -> asyncio.Event:
+        """
+        Event set while the WebSocket is subscribed; must be called on the stream's loop
+        """
+        if self._connected is None:
+            self._connected = asyncio.Event()
+        return self._connected
+
+    async def _call_bot(self, method: Callable[[], Any]) -> Any:
+        """
+        Call a listen-key method of the bot without blocking the event loop
+        """
+        if asyncio.iscoroutinefunction(self._bot._make_request):
+            return await method()
+        return await asyncio.get_running_loop().run_in_executor(None, method)
+
+    async def _keepalive(self) -> None:
+        """
+        Extend the listen key periodically so the stream does not expire
+        """
+        while True:
+            await asyncio.sleep(self.KEEPALIVE_INTERVAL)
+            try:
+                await self._call_bot(self._bot.keepalive_user_stream)
+            except Exception:
+                # Retried at the next interval; an expired key triggers a reconnect
+                logger.warning("Listen key keepalive failed; retrying later", exc_info=True)
+
+    async def _dispatch(self, event: Dict[str, Any]) -> bool:
+        """
+        Record fills and run the callbacks for one event
+
+        Returns:
+            False when the listen key has expired and must be renewed
+        """
+        event_type = event.get("e")
+        if event_type == "listenKeyExpired":
+            return False
+
+        if event_type == "ORDER_TRADE_UPDATE":
+            order = event.get("o", {})
+            if order.get("X") == "FILLED":
+                order_id = order.get("i")
+                self._fills[order_id] = order
+                if len(self._fills) > self.FILL_HISTORY:
+                    self._fills.popitem(last=False)
+                for waiter in self._fill_waiters.get(order_id, ()):
+                    waiter.set()
+
+        for callback in self._callbacks.get(event_type, []):
+            # A failing callback must not stop the stream or the other callbacks
+            try:
+                result = callback(event)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception:
+                logger.exception("User data stream callback failed for %s event", event_type)
+        return True
+
+    async def run(self) -> None:
+        """
+        Consume the stream until cancelled, renewing the listen key and
+        reconnecting when needed
+        """
+        keepalive = None
+        try:
+            while True:
+                try:
+                    response = await self._call_bot(self._bot.start_user_stream)
+                    self.listen_key = response["listenKey"]
+                except Exception:
+                    # The listen key is requested again on every reconnect, so a
+                    # transient REST failure must not end the stream
+                    logger.warning("Listen key request failed; retrying", exc_info=True)
+                    await asyncio.sleep(self.reconnect_delay)
+                    continue
+
+                try:
+                    if keepalive is None:
+                        keepalive = asyncio.ensure_future(self._keepalive())
+                    async with websockets.connect(f"{self._base_url}/ws/{self.listen_key}") as websocket:
+                        self._connected_event().set()
+                        try:
+                            async for message in websocket:
+                                if not await self._dispatch(_json_loads(message)):
+                                    break
+                        finally:
+                            self._connected_event().clear()
+                except (websockets.WebSocketException, OSError):
+                    await asyncio.sleep(self.reconnect_delay)
+        finally:
+            if keepalive is not None:
+                keepalive.cancel()
+            # A restarted stream may run on a different loop
+            self._connected = None
+
+    async def await_connected(self, timeout: Optional[float] = None) -> None:
+        """
+        Wait until the stream is subscribed and events will be delivered
+
+        Orders placed before this returns may fill before the subscription
+        exists, in which case their events are never received.
+
+        Args:
+            timeout: Maximum seconds to wait (default: no limit)
+
+        Raises:
+            asyncio.TimeoutError: If the stream is not connected within timeout
+        """
+        await asyncio.wait_for(self._connected_event().wait(), timeout)
+
+    def wait_until_connected(self, timeout: Optional[float] = None) -> None:
+        """
+        Blocking await_connected for streams started with start_in_thread()
+
+        Args:
+            timeout: Maximum seconds to wait (default: no limit)
+
+        Raises:
+            asyncio.TimeoutError: If the stream is not connected within timeout
+        """
+        future = asyncio.run_coroutine_threadsafe(self.await_connected(timeout), self._loop)
+        future.result()
+
+    async def await_fill(self, order_id: int, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait until an order is reported FILLED
+
+        Must be awaited on the loop the stream runs on.
+
+        Args:
+            order_id: Order ID returned by place_order
+            timeout: Maximum seconds to wait (default: no limit)
+
+        Returns:
+            The order payload ('o') of the FILLED ORDER_TRADE_UPDATE event
+
+        Raises:
+            asyncio.TimeoutError: If the order is not filled within timeout
+        """
+        if order_id not in self._fills:
+            # One Event per call, so a waiter that gives up does not strand the others
+            waiter = asyncio.Event()
+            waiters = self._fill_waiters.setdefault(order_id, [])
+            waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter.wait(), timeout)
+            finally:
+                waiters.remove(waiter)
+                if not waiters:
+                    self._fill_waiters.pop(order_id, None)
+        return self._fills[order_id]
+
+    def wait_for_fill(self, order_id: int, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Blocking await_fill for streams started with start_in_thread()
+
+        Args:
+            order_id: Order ID returned by place_order
+            timeout: Maximum seconds to wait (default: no limit)
+
+        Returns:
+            The order payload ('o') of the FILLED ORDER_TRADE_UPDATE event
+
+        Raises:
+            asyncio.TimeoutError: If the order is not filled within timeout
+        """
+        future = asyncio.run_coroutine_threadsafe(self.await_fill(order_id, timeout), self._loop)
+        return future.result()
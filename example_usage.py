@@ -3,22 +3,43 @@ Example usage of Binance Futures Trading Bot
 This script demonstrates how to use the bot to place orders and check account information.
 """
 
-from binance_futures_bot import BinanceFuturesBot
+import asyncio
+
+from binance_futures_bot import AsyncBinanceFuturesBot, BinanceFuturesBot
 import config
 
 
-def main():
+async def main():
     """
     Example usage of the Binance Futures Trading Bot
     """
     
     # Initialize the bot
     print("Initializing Binance Futures Bot...")
-    bot = BinanceFuturesBot(
+    async with AsyncBinanceFuturesBot(
         api_key=config.API_KEY,
         api_secret=config.API_SECRET,
         testnet=config.USE_TESTNET,
         recv_window=config.RECV_WINDOW
+    ) as bot:
+        await run_examples(bot)
+
+
+async def run_examples(bot: AsyncBinanceFuturesBot):
+    """
+    Run the examples, fetching the independent read-only data concurrently
+    """
+    symbol = "BTCUSDT"
+    
+    # The requests below do not depend on each other, so they are issued at
+    # once; errors are returned in place of results and reported per example.
+    # Open orders are fetched in Example 7 so they include orders placed above it.
+    balance, price, symbol_info, positions = await asyncio.gather(
+        bot.get_balance(),
+        bot.get_current_price(symbol),
+        bot.get_symbol_info(symbol),
+        bot.get_position_info(symbol),
+        return_exceptions=True
     )
     
     # Example 1: Get account information
@@ -26,7 +47,8 @@ def main():
     print("Example 1: Getting Account Information")
     print("="*50)
     try:
-        balance = bot.get_balance()
+        if isinstance(balance, Exception):
+            raise balance
         print(f"Total Wallet Balance: {balance['total_wallet_balance']}")
         print(f"Available Balance: {balance['available_balance']}")
         print(f"Total Unrealized Profit: {balance['total_unrealized_profit']}")
@@ -37,9 +59,9 @@ def main():
     print("\n" + "="*50)
     print("Example 2: Getting Current Price")
     print("="*50)
-    symbol = "BTCUSDT"
     try:
-        price = bot.get_current_price(symbol)
+        if isinstance(price, Exception):
+            raise price
         print(f"Current {symbol} price: ${price:,.2f}")
     except Exception as e:
         print(f"Error getting price: {e}")
@@ -49,7 +71,8 @@ def main():
     print("Example 3: Getting Symbol Information")
     print("="*50)
     try:
-        symbol_info = bot.get_symbol_info(symbol)
+        if isinstance(symbol_info, Exception):
+            raise symbol_info
         if symbol_info:
             print(f"Symbol: {symbol_info['symbol']}")
             print(f"Status: {symbol_info['status']}")
@@ -65,7 +88,8 @@ def main():
     print("Example 4: Getting Position Information")
     print("="*50)
     try:
-        positions = bot.get_position_info(symbol)
+        if isinstance(positions, Exception):
+            raise positions
         if positions:
             for pos in positions:
                 if float(pos.get('positionAmt', 0)) != 0:
@@ -88,7 +112,7 @@ def main():
     try:
         quantity = 0.001  # Adjust this to your desired quantity
         print(f"Placing market BUY order for {quantity} {symbol}...")
-        result = bot.buy_market(symbol=symbol, quantity=quantity)
+        result = await bot.buy_market(symbol=symbol, quantity=quantity)
         print(f"Order placed successfully!")
         print(f"Order ID: {result.get('orderId')}")
         print(f"Status: {result.get('status')}")
@@ -107,7 +131,7 @@ def main():
         quantity = 0.001  # Adjust this to your desired quantity
         limit_price = 50000.0  # Adjust this to your desired price
         print(f"Placing limit SELL order for {quantity} {symbol} at ${limit_price}...")
-        result = bot.sell_limit(
+        result = await bot.sell_limit(
             symbol=symbol,
             quantity=quantity,
             price=limit_price,
@@ -125,7 +149,7 @@ def main():
     print("Example 7: Getting Open Orders")
     print("="*50)
     try:
-        open_orders = bot.get_open_orders(symbol)
+        open_orders = await bot.get_open_orders(symbol)
         if open_orders:
             print(f"Found {len(open_orders)} open order(s):")
             for order in open_orders:
@@ -239,7 +263,7 @@ def interactive_trading():
 
 if __name__ == "__main__":
     # Run examples
-    main()
+    asyncio.run(main())
     
     # Uncomment to run interactive trading mode
     # interactive_trading()